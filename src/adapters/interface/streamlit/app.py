@@ -496,6 +496,16 @@ def _render_cashflow_details(view: CashflowView) -> None:
             st.caption("Aucun flux sortant sur la période.")
 
 
+def _render_accounts_view(accounts: Sequence[AccountDTO]) -> None:
+    """Render the Accounts page, warning when nothing has been synced."""
+    st.caption(f"{len(accounts)} accounts synced "
+               f"from analytics.accounts_dim")
+    if not accounts:
+        st.warning("No accounts found. Run the sync first.")
+        return
+    _render_accounts(accounts)
+
+
 def _render_accounts(accounts: Sequence[AccountDTO]) -> None:
     """Render the accounts table with light filtering."""
     st.subheader("Accounts")
@@ -1058,12 +1068,7 @@ def main() -> None:
         _render_account_tree(account_balances, currency_code)
     elif page == "Accounts":
         accounts = _load_accounts(schema_version=analytics_schema_version)
-        st.caption(f"{len(accounts)} accounts synced "
-                   f"from analytics.accounts_dim")
-        if not accounts:
-            st.warning("No accounts found. Run the sync first.")
-            return
-        _render_accounts(accounts)
+        _render_accounts_view(accounts)
     elif page == "Flux de trésorerie":
         today = date.today()
         start_date, end_date = _get_date_inputs(today, key_prefix="cashflow")
@@ -1,6 +1,8 @@
 """Domain policies for account hygiene."""
 
-_HEX_CHARS = set("0123456789abcdef")
+import re
+
+_HEX_ID_PATTERN = re.compile(r"[0-9a-fA-F]{32}")
 
 
 def is_valid_account_name(name: str) -> bool:
@@ -15,10 +17,8 @@ def is_valid_account_name(name: str) -> bool:
     candidate = name.strip()
     if not candidate:
         return False
-    if len(candidate) == 32:
-        lowered = candidate.lower()
-        if all(char in _HEX_CHARS for char in lowered):
-            return False
+    if len(candidate) == 32 and _HEX_ID_PATTERN.fullmatch(candidate):
+        return False
     return True
 
 
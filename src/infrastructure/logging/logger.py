@@ -231,6 +231,9 @@ class LoggerBuilder:
                               fmt: logging.Formatter) -> logging.Handler:
         """Create the default file handler.
 
+        The file is opened lazily on the first emitted record, so loggers
+        that are built but never written to do not hold a file descriptor.
+
         Args:
             path (Path): Path to the log file.
             fmt (logging.Formatter): Formatter to apply to the handler.
@@ -238,7 +241,7 @@ class LoggerBuilder:
         Returns:
             logging.Handler: Configured FileHandler instance.
         """
-        h = logging.FileHandler(path, encoding="utf-8")
+        h = logging.FileHandler(path, encoding="utf-8", delay=True)
         h.setLevel(logging.INFO)
         h.setFormatter(fmt)
         return h
@@ -0,0 +1,14 @@
+"""Patching helpers shared by the CLI adapter tests."""
+
+
+def batch_setattr(monkeypatch, target, **attrs) -> None:
+    """Patch several attributes of ``target`` through one monkeypatch loop.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture owning the teardown.
+        target: Module or object whose attributes are replaced.
+        **attrs: Attribute names mapped to their replacement values.
+    """
+    setattr_ = monkeypatch.setattr
+    for name, value in attrs.items():
+        setattr_(target, name, value)
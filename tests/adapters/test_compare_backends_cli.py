@@ -9,6 +9,39 @@ from src.application.use_cases.compare_backends import (
     BackendDiff,
     BackendSnapshot,
 )
+from tests.adapters._patching import batch_setattr
+
+
+class _Logger:
+    """Logger stub discarding messages; the CLI tests only inspect stdout."""
+
+    def warning(self, msg: str) -> None:
+        pass
+
+    def error(self, msg: str) -> None:
+        pass
+
+    def info(self, msg: str) -> None:
+        pass
+
+
+class _FakeUseCase:
+    """Use case stub returning a canned comparison."""
+
+    def __init__(
+        self,
+        comparison: BackendComparison,
+        left_repository,
+        right_repository,
+        logger=None,
+    ) -> None:
+        self.comparison = comparison
+        self.left_repository = left_repository
+        self.right_repository = right_repository
+        self.logger = logger
+
+    def execute(self, **_kwargs) -> BackendComparison:
+        return self.comparison
 
 
 def test_main_runs_use_case_and_prints_result(
@@ -21,39 +54,14 @@ def test_main_runs_use_case_and_prints_result(
     dummy_sql_repo = object()
     dummy_piecash_repo = object()
 
-    class _Logger:
-        def __init__(self) -> None:
-            self.messages: list[str] = []
-
-        def warning(self, msg: str) -> None:
-            self.messages.append(msg)
-
-        def error(self, msg: str) -> None:
-            self.messages.append(msg)
-
-        def info(self, msg: str) -> None:
-            self.messages.append(msg)
-
     monkeypatch.setenv("PIECASH_FILE", str(tmp_path))
-    monkeypatch.setattr(
-        compare_backends_cli,
-        "build_database_adapter",
-        lambda: dummy_adapter,
-    )
-    monkeypatch.setattr(
-        compare_backends_cli,
-        "SqlAlchemyGnuCashRepository",
-        lambda adapter: dummy_sql_repo,
-    )
-    monkeypatch.setattr(
-        compare_backends_cli,
-        "PieCashGnuCashRepository",
-        lambda path, logger=None: dummy_piecash_repo,
-    )
-    monkeypatch.setattr(
+    batch_setattr(
+        monkeypatch,
         compare_backends_cli,
-        "get_app_logger",
-        lambda: _Logger(),
+        build_database_adapter=lambda: dummy_adapter,
+        SqlAlchemyGnuCashRepository=lambda adapter: dummy_sql_repo,
+        PieCashGnuCashRepository=lambda path, logger=None: dummy_piecash_repo,
+        get_app_logger=lambda: _Logger(),
     )
 
     comparison = BackendComparison(
@@ -84,23 +92,25 @@ def test_main_runs_use_case_and_prints_result(
         ),
     )
 
-    class _FakeUseCase:
-        def __init__(self, left_repository, right_repository, logger=None):
-            assert left_repository is dummy_sql_repo
-            assert right_repository is dummy_piecash_repo
-            assert logger is not None
+    use_cases: list[_FakeUseCase] = []
 
-        def execute(self, **_kwargs):
-            return comparison
+    def _build_use_case(**kwargs) -> _FakeUseCase:
+        use_case = _FakeUseCase(comparison, **kwargs)
+        use_cases.append(use_case)
+        return use_case
 
     monkeypatch.setattr(
         compare_backends_cli,
         "CompareBackendsUseCase",
-        _FakeUseCase,
+        _build_use_case,
     )
 
     compare_backends_cli.main()
 
+    assert len(use_cases) == 1
+    assert use_cases[0].left_repository is dummy_sql_repo
+    assert use_cases[0].right_repository is dummy_piecash_repo
+    assert use_cases[0].logger is not None
     captured = capsys.readouterr()
     assert "Backend comparison" in captured.out
     assert "Deltas (right - left)" in captured.out
@@ -1,34 +1,23 @@
 """Tests for the sync_accounts_cli adapter."""
 
 from types import SimpleNamespace
-from unittest.mock import MagicMock
 
 from src.adapters import sync_accounts_cli
+from tests.adapters._patching import batch_setattr
 
 
 def test_main_runs_use_case_and_prints_result(monkeypatch, capsys):
     """The CLI should instantiate the use case and print the summary."""
-    fake_logger = MagicMock()
+    fake_logger = object()
     dummy_source = object()
     dummy_destination = object()
-    fake_use_case = MagicMock()
-    fake_use_case.run.return_value = SimpleNamespace(inserted_count=3)
+    run_calls: list[tuple] = []
 
-    monkeypatch.setattr(
-        sync_accounts_cli,
-        "get_app_logger",
-        lambda: fake_logger,
-    )
-    monkeypatch.setattr(
-        sync_accounts_cli,
-        "build_accounts_source",
-        lambda: dummy_source,
-    )
-    monkeypatch.setattr(
-        sync_accounts_cli,
-        "build_accounts_destination",
-        lambda: dummy_destination,
-    )
+    def _run():
+        run_calls.append(())
+        return SimpleNamespace(inserted_count=3)
+
+    fake_use_case = SimpleNamespace(run=_run)
 
     def _fake_use_case(source_port, destination_port, logger):
         assert source_port is dummy_source
@@ -36,14 +25,17 @@ def test_main_runs_use_case_and_prints_result(monkeypatch, capsys):
         assert logger is fake_logger
         return fake_use_case
 
-    monkeypatch.setattr(
+    batch_setattr(
+        monkeypatch,
         sync_accounts_cli,
-        "SyncAccountsUseCase",
-        _fake_use_case,
+        get_app_logger=lambda: fake_logger,
+        build_accounts_source=lambda: dummy_source,
+        build_accounts_destination=lambda: dummy_destination,
+        SyncAccountsUseCase=_fake_use_case,
     )
 
     sync_accounts_cli.main()
 
-    fake_use_case.run.assert_called_once()
+    assert len(run_calls) == 1
     captured = capsys.readouterr()
     assert "3" in captured.out
@@ -20,3 +20,9 @@ def test_is_valid_account_name_accepts_non_hex_or_shorter_values() -> None:
     assert is_valid_account_name("Checking") is True
     assert is_valid_account_name("552dbab9691b4dadb80cc170009f9ccg") is True
     assert is_valid_account_name("deadbeef") is True
+
+
+def test_is_valid_account_name_accepts_hex_like_prefixed_values() -> None:
+    """Values parsed as hex by int() but not pure hex digits are kept."""
+    assert is_valid_account_name("0x" + "a" * 30) is True
+    assert is_valid_account_name("552dbab9_691b4dadb80cc170009f9cc") is True
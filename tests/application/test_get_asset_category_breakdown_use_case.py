@@ -2,7 +2,6 @@
 
 from datetime import date
 from decimal import Decimal
-from unittest.mock import MagicMock
 
 from src.domain.models import AssetCategoryBalanceRow, PriceRow
 from src.application.use_cases.get_asset_category_breakdown import (
@@ -10,17 +9,36 @@ from src.application.use_cases.get_asset_category_breakdown import (
 )
 
 
-def _build_repository(
-    *,
-    currency_guid: str,
-    balances: list[AssetCategoryBalanceRow],
-    prices: list[PriceRow],
-) -> MagicMock:
-    repository = MagicMock()
-    repository.fetch_currency_guid.return_value = currency_guid
-    repository.fetch_asset_category_balances.return_value = balances
-    repository.fetch_latest_prices.return_value = prices
-    return repository
+class _StubRepository:
+    """Repository stub returning canned asset category rows."""
+
+    def __init__(
+        self,
+        currency_guid: str,
+        balances: list[AssetCategoryBalanceRow],
+        prices: list[PriceRow],
+    ) -> None:
+        self._currency_guid = currency_guid
+        self._balances = balances
+        self._prices = prices
+
+    def fetch_currency_guid(self, currency: str) -> str:
+        return self._currency_guid
+
+    def fetch_asset_category_balances(
+        self,
+        start_date: date | None,
+        end_date: date | None,
+        actif_root_name: str,
+    ) -> list[AssetCategoryBalanceRow]:
+        return self._balances
+
+    def fetch_latest_prices(
+        self,
+        currency_guid: str,
+        end_date: date | None,
+    ) -> list[PriceRow]:
+        return self._prices
 
 
 def test_execute_returns_category_amounts_in_eur() -> None:
@@ -77,7 +95,7 @@ def test_execute_returns_category_amounts_in_eur() -> None:
             date=date(2024, 1, 6),
         ),
     ]
-    repository = _build_repository(
+    repository = _StubRepository(
         currency_guid="eur-guid",
         balances=balances,
         prices=prices,
@@ -133,7 +151,7 @@ def test_execute_returns_subcategory_amounts_in_eur() -> None:
             date=date(2024, 1, 6),
         ),
     ]
-    repository = _build_repository(
+    repository = _StubRepository(
         currency_guid="eur-guid",
         balances=balances,
         prices=prices,
@@ -2,25 +2,59 @@
 
 from datetime import date
 from decimal import Decimal
-from unittest.mock import MagicMock
 
 from src.domain.models import NetWorthBalanceRow, PriceRow
 from src.application.use_cases.get_net_worth_summary import (
     GetNetWorthSummaryUseCase,
 )
 
+_D_100_00 = Decimal("100.00")
+_D_NEG_40_25 = Decimal("-40.25")
+_D_999_00 = Decimal("999.00")
+_D_2_0 = Decimal("2.0")
+_D_9 = Decimal("9")
+_D_10 = Decimal("10")
+_D_50 = Decimal("50")
+_D_1 = Decimal("1")
+_D_10_00 = Decimal("10.00")
+_D_190_00 = Decimal("190.00")
+_D_40_25 = Decimal("40.25")
+_D_149_75 = Decimal("149.75")
 
-def _build_repository(
-    *,
-    currency_guid: str,
-    balances: list[NetWorthBalanceRow],
-    prices: list[PriceRow],
-) -> MagicMock:
-    repository = MagicMock()
-    repository.fetch_currency_guid.return_value = currency_guid
-    repository.fetch_net_worth_balances.return_value = balances
-    repository.fetch_latest_prices.return_value = prices
-    return repository
+
+class _StubRepository:
+    """Repository stub returning canned rows and recording fetch calls."""
+
+    def __init__(
+        self,
+        currency_guid: str,
+        balances: list[NetWorthBalanceRow],
+        prices: list[PriceRow],
+    ) -> None:
+        self._currency_guid = currency_guid
+        self._balances = balances
+        self._prices = prices
+        self.balance_calls: list[tuple[date | None, date | None]] = []
+        self.price_calls: list[tuple[str, date | None]] = []
+
+    def fetch_currency_guid(self, currency: str) -> str:
+        return self._currency_guid
+
+    def fetch_net_worth_balances(
+        self,
+        start_date: date | None,
+        end_date: date | None,
+    ) -> list[NetWorthBalanceRow]:
+        self.balance_calls.append((start_date, end_date))
+        return self._balances
+
+    def fetch_latest_prices(
+        self,
+        currency_guid: str,
+        end_date: date | None,
+    ) -> list[PriceRow]:
+        self.price_calls.append((currency_guid, end_date))
+        return self._prices
 
 
 def test_execute_returns_summary_totals() -> None:
@@ -31,45 +65,45 @@ def test_execute_returns_summary_totals() -> None:
             commodity_guid="usd-guid",
             mnemonic="USD",
             namespace="CURRENCY",
-            balance=Decimal("100.00"),
+            balance=_D_100_00,
         ),
         NetWorthBalanceRow(
             account_type="LIABILITY",
             commodity_guid="eur-guid",
             mnemonic="EUR",
             namespace="CURRENCY",
-            balance=Decimal("-40.25"),
+            balance=_D_NEG_40_25,
         ),
         NetWorthBalanceRow(
             account_type="INCOME",
             commodity_guid="eur-guid",
             mnemonic="EUR",
             namespace="CURRENCY",
-            balance=Decimal("999.00"),
+            balance=_D_999_00,
         ),
         NetWorthBalanceRow(
             account_type="STOCK",
             commodity_guid="stock-guid",
             mnemonic="ACME",
             namespace="NASDAQ",
-            balance=Decimal("2.0"),
+            balance=_D_2_0,
         ),
     ]
     prices = [
         PriceRow(
             commodity_guid="usd-guid",
-            value_num=Decimal("9"),
-            value_denom=Decimal("10"),
+            value_num=_D_9,
+            value_denom=_D_10,
             date=date(2024, 1, 5),
         ),
         PriceRow(
             commodity_guid="stock-guid",
-            value_num=Decimal("50"),
-            value_denom=Decimal("1"),
+            value_num=_D_50,
+            value_denom=_D_1,
             date=date(2024, 1, 6),
         ),
     ]
-    repository = _build_repository(
+    repository = _StubRepository(
         currency_guid="eur-guid",
         balances=balances,
         prices=prices,
@@ -81,9 +115,9 @@ def test_execute_returns_summary_totals() -> None:
 
     result = use_case.execute()
 
-    assert result.asset_total == Decimal("190.00")
-    assert result.liability_total == Decimal("40.25")
-    assert result.net_worth == Decimal("149.75")
+    assert result.asset_total == _D_190_00
+    assert result.liability_total == _D_40_25
+    assert result.net_worth == _D_149_75
     assert result.currency_code == "EUR"
 
 
@@ -95,11 +129,11 @@ def test_execute_applies_date_filters() -> None:
             commodity_guid="eur-guid",
             mnemonic="EUR",
             namespace="CURRENCY",
-            balance=Decimal("10.00"),
+            balance=_D_10_00,
         ),
     ]
     prices = []
-    repository = _build_repository(
+    repository = _StubRepository(
         currency_guid="eur-guid",
         balances=balances,
         prices=prices,
@@ -113,11 +147,5 @@ def test_execute_applies_date_filters() -> None:
     end_date = date(2024, 3, 31)
     use_case.execute(start_date=start_date, end_date=end_date)
 
-    repository.fetch_net_worth_balances.assert_called_once_with(
-        start_date,
-        end_date,
-    )
-    repository.fetch_latest_prices.assert_called_once_with(
-        "eur-guid",
-        end_date,
-    )
+    assert repository.balance_calls == [(start_date, end_date)]
+    assert repository.price_calls == [("eur-guid", end_date)]
@@ -3,6 +3,8 @@
 from datetime import date
 from decimal import Decimal
 
+import pytest
+
 from src.application.ports.gnucash_repository import GnuCashRepositoryPort
 from src.domain.models import (
     AssetCategoryBalanceRow,
@@ -16,6 +18,16 @@ from src.application.use_cases.get_net_worth_summary import (
     GetNetWorthSummaryUseCase,
 )
 
+_D_100_00 = Decimal("100.00")
+_D_NEG_10_00 = Decimal("-10.00")
+_D_2 = Decimal("2")
+_D_1 = Decimal("1")
+_D_50_00 = Decimal("50.00")
+_D_25_00 = Decimal("25.00")
+_D_200_00 = Decimal("200.00")
+_D_10_00 = Decimal("10.00")
+_D_190_00 = Decimal("190.00")
+
 
 class FakeGnuCashRepository(GnuCashRepositoryPort):
     """Fake repository representing a non-SQL backend like piecash."""
@@ -58,9 +70,10 @@ class FakeGnuCashRepository(GnuCashRepositoryPort):
         return list(self._prices)
 
 
-def test_net_worth_use_case_accepts_fake_repository() -> None:
-    """Use case should operate with a non-SQL repository."""
-    repository = FakeGnuCashRepository(
+@pytest.fixture(scope="module")
+def net_worth_repository() -> FakeGnuCashRepository:
+    """Fake repository seeded with net worth balances."""
+    return FakeGnuCashRepository(
         currency_guid="eur-guid",
         balances=[
             NetWorthBalanceRow(
@@ -68,38 +81,32 @@ def test_net_worth_use_case_accepts_fake_repository() -> None:
                 commodity_guid="usd-guid",
                 mnemonic="USD",
                 namespace="CURRENCY",
-                balance=Decimal("100.00"),
+                balance=_D_100_00,
             ),
             NetWorthBalanceRow(
                 account_type="LIABILITY",
                 commodity_guid="eur-guid",
                 mnemonic="EUR",
                 namespace="CURRENCY",
-                balance=Decimal("-10.00"),
+                balance=_D_NEG_10_00,
             ),
         ],
         categories=[],
         prices=[
             PriceRow(
                 commodity_guid="usd-guid",
-                value_num=Decimal("2"),
-                value_denom=Decimal("1"),
+                value_num=_D_2,
+                value_denom=_D_1,
                 date=date(2024, 2, 1),
             ),
         ],
     )
 
-    use_case = GetNetWorthSummaryUseCase(gnucash_repository=repository)
-    result = use_case.execute()
-
-    assert result.asset_total == Decimal("200.00")
-    assert result.liability_total == Decimal("10.00")
-    assert result.net_worth == Decimal("190.00")
-
 
-def test_asset_breakdown_use_case_accepts_fake_repository() -> None:
-    """Use case should operate with a non-SQL repository."""
-    repository = FakeGnuCashRepository(
+@pytest.fixture(scope="module")
+def asset_breakdown_repository() -> FakeGnuCashRepository:
+    """Fake repository seeded with asset category balances."""
+    return FakeGnuCashRepository(
         currency_guid="eur-guid",
         balances=[],
         categories=[
@@ -110,7 +117,7 @@ def test_asset_breakdown_use_case_accepts_fake_repository() -> None:
                 namespace="CURRENCY",
                 actif_category="Liquid",
                 actif_subcategory="Cash",
-                balance=Decimal("50.00"),
+                balance=_D_50_00,
             ),
             AssetCategoryBalanceRow(
                 account_type="ASSET",
@@ -119,25 +126,44 @@ def test_asset_breakdown_use_case_accepts_fake_repository() -> None:
                 namespace="CURRENCY",
                 actif_category="Liquid",
                 actif_subcategory="Broker",
-                balance=Decimal("25.00"),
+                balance=_D_25_00,
             ),
         ],
         prices=[
             PriceRow(
                 commodity_guid="usd-guid",
-                value_num=Decimal("2"),
-                value_denom=Decimal("1"),
+                value_num=_D_2,
+                value_denom=_D_1,
                 date=date(2024, 2, 1),
             ),
         ],
     )
 
+
+def test_net_worth_use_case_accepts_fake_repository(
+    net_worth_repository: FakeGnuCashRepository,
+) -> None:
+    """Use case should operate with a non-SQL repository."""
+    use_case = GetNetWorthSummaryUseCase(
+        gnucash_repository=net_worth_repository
+    )
+    result = use_case.execute()
+
+    assert result.asset_total == _D_200_00
+    assert result.liability_total == _D_10_00
+    assert result.net_worth == _D_190_00
+
+
+def test_asset_breakdown_use_case_accepts_fake_repository(
+    asset_breakdown_repository: FakeGnuCashRepository,
+) -> None:
+    """Use case should operate with a non-SQL repository."""
     use_case = GetAssetCategoryBreakdownUseCase(
-        gnucash_repository=repository
+        gnucash_repository=asset_breakdown_repository
     )
     result = use_case.execute(level=2)
 
     labels = [entry.category for entry in result.categories]
     assert labels == ["Broker", "Cash"]
     amounts = [entry.amount for entry in result.categories]
-    assert amounts == [Decimal("50.00"), Decimal("50.00")]
+    assert amounts == [_D_50_00, _D_50_00]
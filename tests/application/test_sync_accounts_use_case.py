@@ -2,45 +2,83 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import pytest
 
 from src.application.ports.accounts_sync import AccountRecord
 from src.application.use_cases.sync_accounts import SyncAccountsUseCase
 
+_CHECKING = AccountRecord(
+    guid="a",
+    name="Checking",
+    account_type="BANK",
+    commodity_guid="USD",
+    parent_guid="ROOT",
+)
+_SAVINGS = AccountRecord(
+    guid="b",
+    name="Savings",
+    account_type="BANK",
+    commodity_guid="USD",
+    parent_guid="ROOT",
+)
+_REAL_ACCOUNT = AccountRecord(
+    guid="c",
+    name="Real Account",
+    account_type="CASH",
+    commodity_guid="USD",
+    parent_guid="ROOT",
+)
+_HEX_NAMED_ACCOUNT = AccountRecord(
+    guid="b",
+    name="552dbab9691b4dadb80cc170009f9cce",
+    account_type="BANK",
+    commodity_guid="USD",
+    parent_guid="ROOT",
+)
+
+_BATCH_RECORD_FIELDS = {
+    "account_type": "BANK",
+    "commodity_guid": "USD",
+    "parent_guid": "ROOT",
+}
+
+
+class _StubSource:
+    """Source port stub returning canned account records."""
+
+    def __init__(self, accounts: list[AccountRecord]) -> None:
+        self.accounts = accounts
+
+    def fetch_accounts(self) -> list[AccountRecord]:
+        return self.accounts
+
+
+class _StubDestination:
+    """Destination port stub recording prepare and refresh calls."""
+
+    def __init__(self) -> None:
+        self.prepare_calls = 0
+        self.refresh_calls: list[list[AccountRecord]] = []
+
+    def prepare_destination(self) -> None:
+        self.prepare_calls += 1
+
+    def refresh_accounts(self, accounts: list[AccountRecord]) -> int:
+        self.refresh_calls.append(accounts)
+        return len(accounts)
+
 
 def _build_ports(
     accounts: list[AccountRecord],
-) -> tuple[MagicMock, MagicMock]:
+) -> tuple[_StubSource, _StubDestination]:
     """Create configured source/destination ports for the tests."""
-    source_port = MagicMock()
-    source_port.fetch_accounts.return_value = accounts
-    destination_port = MagicMock()
-    destination_port.prepare_destination.return_value = None
-    destination_port.refresh_accounts.side_effect = (
-        lambda records: len(records)
-    )
-    return source_port, destination_port
+    return _StubSource(accounts), _StubDestination()
 
 
 def test_run_refreshes_analytics_with_sorted_accounts() -> None:
     """The use case should insert sorted accounts into the analytics table."""
     source_port, destination_port = _build_ports(
-        accounts=[
-            AccountRecord(
-                guid="b",
-                name="Savings",
-                account_type="BANK",
-                commodity_guid="USD",
-                parent_guid="ROOT",
-            ),
-            AccountRecord(
-                guid="a",
-                name="Checking",
-                account_type="BANK",
-                commodity_guid="USD",
-                parent_guid="ROOT",
-            ),
-        ]
+        accounts=[_SAVINGS, _CHECKING]
     )
 
     use_case = SyncAccountsUseCase(
@@ -50,10 +88,8 @@ def test_run_refreshes_analytics_with_sorted_accounts() -> None:
 
     result = use_case.run()
 
-    destination_port.prepare_destination.assert_called_once()
-    destination_port.refresh_accounts.assert_called_once()
-    passed_accounts = destination_port.refresh_accounts.call_args.args[0]
-    assert [acc.guid for acc in passed_accounts] == ["a", "b"]
+    assert destination_port.prepare_calls == 1
+    assert destination_port.refresh_calls == [[_CHECKING, _SAVINGS]]
     assert result.source_count == 2
     assert result.inserted_count == 2
 
@@ -69,8 +105,8 @@ def test_run_handles_empty_source_without_insert() -> None:
 
     result = use_case.run()
 
-    destination_port.prepare_destination.assert_called_once()
-    destination_port.refresh_accounts.assert_called_once_with([])
+    assert destination_port.prepare_calls == 1
+    assert destination_port.refresh_calls == [[]]
     assert result.source_count == 0
     assert result.inserted_count == 0
 
@@ -78,29 +114,7 @@ def test_run_handles_empty_source_without_insert() -> None:
 def test_run_filters_hex_named_accounts() -> None:
     """Accounts with hex-only names should be filtered out."""
     source_port, destination_port = _build_ports(
-        accounts=[
-            AccountRecord(
-                guid="b",
-                name="552dbab9691b4dadb80cc170009f9cce",
-                account_type="BANK",
-                commodity_guid="USD",
-                parent_guid="ROOT",
-            ),
-            AccountRecord(
-                guid="c",
-                name="Real Account",
-                account_type="CASH",
-                commodity_guid="USD",
-                parent_guid="ROOT",
-            ),
-            AccountRecord(
-                guid="a",
-                name="Checking",
-                account_type="BANK",
-                commodity_guid="USD",
-                parent_guid="ROOT",
-            ),
-        ]
+        accounts=[_HEX_NAMED_ACCOUNT, _REAL_ACCOUNT, _CHECKING]
     )
 
     use_case = SyncAccountsUseCase(
@@ -110,7 +124,35 @@ def test_run_filters_hex_named_accounts() -> None:
 
     result = use_case.run()
 
-    passed_accounts = destination_port.refresh_accounts.call_args.args[0]
-    assert [acc.guid for acc in passed_accounts] == ["a", "c"]
+    assert destination_port.refresh_calls == [[_CHECKING, _REAL_ACCOUNT]]
     assert result.source_count == 3
     assert result.inserted_count == 2
+
+
+@pytest.mark.parametrize("count", [3, 1000])
+def test_run_filters_and_sorts_batches(count: int) -> None:
+    """Filtering and sorting should hold for larger source batches."""
+    accounts = [
+        AccountRecord(
+            guid=f"{index:05d}",
+            name=f"{index:032x}" if index % 3 == 0 else f"Account {index}",
+            **_BATCH_RECORD_FIELDS,
+        )
+        for index in reversed(range(count))
+    ]
+    source_port, destination_port = _build_ports(accounts=accounts)
+
+    use_case = SyncAccountsUseCase(
+        source_port=source_port,
+        destination_port=destination_port,
+    )
+
+    result = use_case.run()
+
+    expected_guids = [
+        f"{index:05d}" for index in range(count) if index % 3 != 0
+    ]
+    [passed_accounts] = destination_port.refresh_calls
+    assert [acc.guid for acc in passed_accounts] == expected_guids
+    assert result.source_count == count
+    assert result.inserted_count == len(expected_guids)
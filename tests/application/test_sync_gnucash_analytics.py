@@ -1,9 +1,10 @@
 """Tests for the GnuCash analytics sync use case."""
 
 from datetime import date
-from pathlib import Path
 
+import pytest
 from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
 
 from src.application.use_cases.sync_gnucash_analytics import (
     SyncGnuCashAnalyticsUseCase,
@@ -11,10 +12,147 @@ from src.application.use_cases.sync_gnucash_analytics import (
 from src.application.ports.database import DatabaseEnginePort
 
 
+_INSERT_ACCOUNTS_SQL = text(
+    """
+    INSERT INTO accounts (guid, name, account_type, commodity_guid, parent_guid)
+    VALUES (:guid, :name, :account_type, :commodity_guid, :parent_guid)
+    """
+)
+_INSERT_COMMODITIES_SQL = text(
+    """
+    INSERT INTO commodities (guid, mnemonic, namespace)
+    VALUES (:guid, :mnemonic, :namespace)
+    """
+)
+_INSERT_TRANSACTIONS_SQL = text(
+    """
+    INSERT INTO transactions (guid, post_date)
+    VALUES (:guid, :post_date)
+    """
+)
+_INSERT_SPLITS_SQL = text(
+    """
+    INSERT INTO splits (
+        guid,
+        account_guid,
+        tx_guid,
+        value_num,
+        value_denom,
+        quantity_num,
+        quantity_denom
+    )
+    VALUES (
+        :guid,
+        :account_guid,
+        :tx_guid,
+        :value_num,
+        :value_denom,
+        :quantity_num,
+        :quantity_denom
+    )
+    """
+)
+_INSERT_PRICES_SQL = text(
+    """
+    INSERT INTO prices (
+        guid,
+        commodity_guid,
+        currency_guid,
+        value_num,
+        value_denom,
+        date
+    )
+    VALUES (
+        :guid,
+        :commodity_guid,
+        :currency_guid,
+        :value_num,
+        :value_denom,
+        :date
+    )
+    """
+)
+
+_ACCOUNT_ROWS = [
+    {
+        "guid": "acc-1",
+        "name": "Assets",
+        "account_type": "ASSET",
+        "commodity_guid": "cur-1",
+        "parent_guid": None,
+    },
+    {
+        "guid": "acc-2",
+        "name": "Bank",
+        "account_type": "ASSET",
+        "commodity_guid": "cur-1",
+        "parent_guid": "acc-1",
+    },
+]
+_COMMODITY_ROWS = [
+    {"guid": "cur-1", "mnemonic": "EUR", "namespace": "CURRENCY"},
+]
+_TRANSACTION_ROWS = [
+    {"guid": "tx-1", "post_date": date(2024, 1, 1)},
+]
+_SPLIT_ROWS = [
+    {
+        "guid": "split-1",
+        "account_guid": "acc-1",
+        "tx_guid": "tx-1",
+        "value_num": 100,
+        "value_denom": 1,
+        "quantity_num": 100,
+        "quantity_denom": 1,
+    },
+    {
+        "guid": "split-2",
+        "account_guid": "acc-2",
+        "tx_guid": "tx-1",
+        "value_num": 50,
+        "value_denom": 1,
+        "quantity_num": 50,
+        "quantity_denom": 1,
+    },
+]
+_PRICE_ROWS = [
+    {
+        "guid": "price-1",
+        "commodity_guid": "cur-1",
+        "currency_guid": "cur-1",
+        "value_num": 1,
+        "value_denom": 1,
+        "date": date(2024, 1, 2),
+    },
+]
+
+
+def _create_memory_engine():
+    """Create an in-memory SQLite engine backed by a single connection."""
+    return create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+
+def _clone_engine(source):
+    """Copy an in-memory SQLite database into a fresh engine."""
+    target = _create_memory_engine()
+    source_conn = source.raw_connection()
+    target_conn = target.raw_connection()
+    try:
+        source_conn.driver_connection.backup(target_conn.driver_connection)
+    finally:
+        target_conn.close()
+        source_conn.close()
+    return target
+
+
 class _FakeDatabasePort(DatabaseEnginePort):
-    def __init__(self, gnucash_url: str, analytics_url: str) -> None:
-        self._gnucash_engine = create_engine(gnucash_url)
-        self._analytics_engine = create_engine(analytics_url)
+    def __init__(self, gnucash_engine) -> None:
+        self._gnucash_engine = gnucash_engine
+        self._analytics_engine = _create_memory_engine()
 
     def get_gnucash_engine(self):
         return self._gnucash_engine
@@ -23,17 +161,25 @@ class _FakeDatabasePort(DatabaseEnginePort):
         return self._analytics_engine
 
 
-def test_sync_gnucash_analytics_copies_tables(tmp_path: Path) -> None:
-    """Sync should copy core tables into analytics."""
-    gnucash_db = tmp_path / "gnucash.db"
-    analytics_db = tmp_path / "analytics.db"
-    db_port = _FakeDatabasePort(
-        f"sqlite:///{gnucash_db}",
-        f"sqlite:///{analytics_db}",
-    )
+@pytest.fixture(scope="module")
+def seeded_gnucash_engine():
+    """GnuCash source database seeded once per module."""
+    engine = _create_memory_engine()
+    _seed_source_db(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_port(seeded_gnucash_engine) -> _FakeDatabasePort:
+    """Database port with a private copy of the seeded source database."""
+    return _FakeDatabasePort(_clone_engine(seeded_gnucash_engine))
 
-    _seed_source_db(db_port.get_gnucash_engine())
 
+def test_sync_gnucash_analytics_copies_tables(
+    db_port: _FakeDatabasePort,
+) -> None:
+    """Sync should copy core tables into analytics."""
     use_case = SyncGnuCashAnalyticsUseCase(db_port=db_port, chunk_size=2)
     result = use_case.run()
 
@@ -106,119 +252,8 @@ def _seed_source_db(engine) -> None:
             )
             """
         )
-        conn.execute(
-            text(
-                """
-                INSERT INTO accounts (guid, name, account_type, commodity_guid, parent_guid)
-                VALUES (:guid, :name, :account_type, :commodity_guid, :parent_guid)
-                """
-            ),
-            [
-                {
-                    "guid": "acc-1",
-                    "name": "Assets",
-                    "account_type": "ASSET",
-                    "commodity_guid": "cur-1",
-                    "parent_guid": None,
-                },
-                {
-                    "guid": "acc-2",
-                    "name": "Bank",
-                    "account_type": "ASSET",
-                    "commodity_guid": "cur-1",
-                    "parent_guid": "acc-1",
-                },
-            ],
-        )
-        conn.execute(
-            text(
-                """
-                INSERT INTO commodities (guid, mnemonic, namespace)
-                VALUES (:guid, :mnemonic, :namespace)
-                """
-            ),
-            {"guid": "cur-1", "mnemonic": "EUR", "namespace": "CURRENCY"},
-        )
-        conn.execute(
-            text(
-                """
-                INSERT INTO transactions (guid, post_date)
-                VALUES (:guid, :post_date)
-                """
-            ),
-            {"guid": "tx-1", "post_date": date(2024, 1, 1)},
-        )
-        conn.execute(
-            text(
-                """
-                INSERT INTO splits (
-                    guid,
-                    account_guid,
-                    tx_guid,
-                    value_num,
-                    value_denom,
-                    quantity_num,
-                    quantity_denom
-                )
-                VALUES (
-                    :guid,
-                    :account_guid,
-                    :tx_guid,
-                    :value_num,
-                    :value_denom,
-                    :quantity_num,
-                    :quantity_denom
-                )
-                """
-            ),
-            [
-                {
-                    "guid": "split-1",
-                    "account_guid": "acc-1",
-                    "tx_guid": "tx-1",
-                    "value_num": 100,
-                    "value_denom": 1,
-                    "quantity_num": 100,
-                    "quantity_denom": 1,
-                },
-                {
-                    "guid": "split-2",
-                    "account_guid": "acc-2",
-                    "tx_guid": "tx-1",
-                    "value_num": 50,
-                    "value_denom": 1,
-                    "quantity_num": 50,
-                    "quantity_denom": 1,
-                },
-            ],
-        )
-        conn.execute(
-            text(
-                """
-                INSERT INTO prices (
-                    guid,
-                    commodity_guid,
-                    currency_guid,
-                    value_num,
-                    value_denom,
-                    date
-                )
-                VALUES (
-                    :guid,
-                    :commodity_guid,
-                    :currency_guid,
-                    :value_num,
-                    :value_denom,
-                    :date
-                )
-                """
-            ),
-            {
-                "guid": "price-1",
-                "commodity_guid": "cur-1",
-                "currency_guid": "cur-1",
-                "value_num": 1,
-                "value_denom": 1,
-                "date": date(2024, 1, 2),
-            },
-        )
+        conn.execute(_INSERT_ACCOUNTS_SQL, _ACCOUNT_ROWS)
+        conn.execute(_INSERT_COMMODITIES_SQL, _COMMODITY_ROWS)
+        conn.execute(_INSERT_TRANSACTIONS_SQL, _TRANSACTION_ROWS)
+        conn.execute(_INSERT_SPLITS_SQL, _SPLIT_ROWS)
+        conn.execute(_INSERT_PRICES_SQL, _PRICE_ROWS)
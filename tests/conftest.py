@@ -3,6 +3,44 @@
 from pathlib import Path
 import sys
 
+import pytest
+import streamlit
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+_ORIGINAL_CACHES = {}
+
+
+def _passthrough_cache(func=None, **_kwargs):
+    """Stand in for st.cache_data/st.cache_resource without caching."""
+    if func is None:
+        return lambda wrapped: wrapped
+    return func
+
+
+def pytest_configure(config) -> None:
+    """Disable Streamlit caching before any test module imports the app.
+
+    app.py applies ``@st.cache_data`` at import time, and test modules under
+    both tests/adapters and tests/interface import it during collection. Only
+    this root conftest is loaded before every one of them.
+    """
+    for name in ("cache_data", "cache_resource"):
+        _ORIGINAL_CACHES[name] = getattr(streamlit, name)
+        setattr(streamlit, name, _passthrough_cache)
+
+
+def pytest_unconfigure(config) -> None:
+    """Restore the Streamlit cache decorators."""
+    for name, original in _ORIGINAL_CACHES.items():
+        setattr(streamlit, name, original)
+    _ORIGINAL_CACHES.clear()
+
+
+def pytest_collection_modifyitems(items) -> None:
+    """Mark tests that request the tmp_path fixture as io."""
+    for item in items:
+        if "tmp_path" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.io)
@@ -0,0 +1,104 @@
+"""Fake piecash objects shared by the piecash adapter tests."""
+
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+
+@dataclass(slots=True)
+class FakeCommodity:
+    """Commodity identified by guid, mnemonic and namespace."""
+
+    guid: str
+    mnemonic: str | None = None
+    namespace: str | None = None
+
+
+@dataclass(slots=True)
+class FakeNumeric:
+    """Fraction-like value exposing num/denom like piecash numerics."""
+
+    num: object
+    denom: object
+
+
+@dataclass(slots=True)
+class FakeTransaction:
+    """Transaction exposing only its post date."""
+
+    post_date: object
+
+
+@dataclass(slots=True)
+class FakeAccount:
+    """Account with the attributes read by the piecash adapters."""
+
+    guid: str
+    name: str
+    type: str
+    commodity: FakeCommodity | None
+    parent: "FakeAccount | None" = None
+
+
+@dataclass(slots=True)
+class FakeSplit:
+    """Split linking an account, a transaction and a value."""
+
+    account: FakeAccount
+    transaction: FakeTransaction
+    value: FakeNumeric
+
+
+@dataclass(slots=True)
+class FakePrice:
+    """Price of a commodity expressed in a currency."""
+
+    commodity: FakeCommodity
+    currency: FakeCommodity
+    date: object
+    value_num: object
+    value_denom: object
+
+
+class FakeBook:
+    """Book holding fake collections and tracking whether it was closed."""
+
+    def __init__(
+        self,
+        *,
+        accounts=(),
+        commodities=(),
+        splits=(),
+        prices=(),
+    ) -> None:
+        self.accounts = list(accounts)
+        self.commodities = list(commodities)
+        self.splits = list(splits)
+        self.prices = list(prices)
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def make_open_book(book_factory, expected_path=None):
+    """Return an open_book stub checking the read-only opening arguments.
+
+    Args:
+        book_factory: Callable returning the book to hand back.
+        expected_path: Optional path the adapter must open, compared as str.
+    """
+
+    def _open_book(path, readonly=True, open_if_lock=True, check_exists=False):
+        if expected_path is not None:
+            assert path == str(expected_path)
+        assert readonly is True
+        assert open_if_lock is True
+        assert check_exists is False
+        return book_factory()
+
+    return _open_book
+
+
+def fake_piecash_module(open_book) -> SimpleNamespace:
+    """Return a piecash module stand-in exposing the given open_book."""
+    return SimpleNamespace(open_book=open_book)
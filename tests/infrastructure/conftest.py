@@ -0,0 +1,26 @@
+"""Shared fixtures for the infrastructure tests."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.ports.database import DatabaseEnginePort
+from src.infrastructure import db as db_module
+
+
+@pytest.fixture(autouse=True)
+def _no_dotenv(monkeypatch):
+    """Keep tests from scanning the filesystem for a real .env file."""
+    monkeypatch.setattr(db_module.dotenv, "load_dotenv", lambda: None)
+
+
+@pytest.fixture(scope="session")
+def db_port_mock() -> MagicMock:
+    """Database port mock shared by tests that only pass it through."""
+    return MagicMock(spec=DatabaseEnginePort)
+
+
+@pytest.fixture(scope="session")
+def fake_piecash_path(tmp_path_factory):
+    """Stable book path for piecash tests whose open_book is faked."""
+    return tmp_path_factory.mktemp("piecash", numbered=False)
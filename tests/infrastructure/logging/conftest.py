@@ -0,0 +1,30 @@
+"""Shared fixtures for the logging tests."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.logging import logger as logger_module
+
+
+@pytest.fixture(autouse=True)
+def _reset_logger_singletons(monkeypatch):
+    """Start each test without cached logger singletons."""
+    for logger_cls in (
+        logger_module.Logger,
+        logger_module.AppLogger,
+        logger_module.UsageLogger,
+    ):
+        monkeypatch.setattr(logger_cls, "_instance", None)
+
+
+@pytest.fixture
+def fake_logger(monkeypatch) -> MagicMock:
+    """Make LoggerBuilder.build return a shared MagicMock logger."""
+    fake = MagicMock()
+    monkeypatch.setattr(
+        logger_module.LoggerBuilder,
+        "build",
+        lambda self: fake,
+    )
+    return fake
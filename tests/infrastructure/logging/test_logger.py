@@ -1,10 +1,13 @@
 """Tests for the logging helpers."""
 
 import logging
-from unittest.mock import MagicMock
+
+import pytest
 
 from src.infrastructure.logging import logger as logger_module
 
+pytestmark = pytest.mark.infrastructure_unit
+
 
 def test_logger_builder_creates_configured_logger(tmp_path, monkeypatch):
     """LoggerBuilder should build loggers in the project logs directory."""
@@ -32,18 +35,23 @@ def test_logger_builder_creates_configured_logger(tmp_path, monkeypatch):
         .build()
     )
 
-    assert custom_logger.name == "custom"
-    assert custom_logger.level == logging.WARNING
-    file_handlers = [
-        h
-        for h in custom_logger.handlers
-        if isinstance(h, logging.FileHandler)
-    ]
-    assert len(file_handlers) == 1
-    expected_path = tmp_path / "logs" / "etl" / "20240101_etl_logs.log"
-    assert file_handlers[0].baseFilename == str(expected_path)
-    # Building again should reuse the same logger instance.
-    assert builder.build() is custom_logger
+    try:
+        assert custom_logger.name == "custom"
+        assert custom_logger.level == logging.WARNING
+        file_handlers = [
+            h
+            for h in custom_logger.handlers
+            if isinstance(h, logging.FileHandler)
+        ]
+        assert len(file_handlers) == 1
+        expected_path = tmp_path / "logs" / "etl" / "20240101_etl_logs.log"
+        assert file_handlers[0].baseFilename == str(expected_path)
+        # Building again should reuse the same logger instance.
+        assert builder.build() is custom_logger
+    finally:
+        for handler in list(custom_logger.handlers):
+            custom_logger.removeHandler(handler)
+            handler.close()
 
 
 def test_default_handlers_use_formatter(tmp_path):
@@ -58,22 +66,16 @@ def test_default_handlers_use_formatter(tmp_path):
     assert isinstance(file_handler, logging.FileHandler)
     assert file_handler.level == logging.INFO
     assert file_handler.formatter is fmt
+    assert file_handler.stream is None
+    assert not (tmp_path / "logs.log").exists()
 
     assert isinstance(console_handler, logging.StreamHandler)
     assert console_handler.level == logging.INFO
     assert console_handler.formatter is fmt
 
 
-def test_logger_singleton_delegates_to_underlying_logger(monkeypatch):
+def test_logger_singleton_delegates_to_underlying_logger(fake_logger):
     """Logger info/warning/error/etc. should call the wrapped logger."""
-    fake_logger = MagicMock()
-    monkeypatch.setattr(
-        logger_module.LoggerBuilder,
-        "build",
-        lambda self: fake_logger,
-    )
-    logger_module.Logger._instance = None
-
     logger = logger_module.Logger("app")
     logger.info("hello")
     logger.warning("warn")
@@ -90,21 +92,8 @@ def test_logger_singleton_delegates_to_underlying_logger(monkeypatch):
     assert logger_module.Logger("app") is logger
 
 
-def test_app_and_usage_loggers_share_builder_singletons(monkeypatch):
+def test_app_and_usage_loggers_share_builder_singletons(fake_logger):
     """get_app_logger and get_usage_logger should return singletons."""
-    fake_logger = MagicMock()
-
-    def _fake_build(self):
-        return fake_logger
-
-    monkeypatch.setattr(
-        logger_module.LoggerBuilder,
-        "build",
-        _fake_build,
-    )
-    logger_module.AppLogger._instance = None
-    logger_module.UsageLogger._instance = None
-
     app_logger_1 = logger_module.get_app_logger()
     app_logger_2 = logger_module.get_app_logger()
     usage_logger_1 = logger_module.get_usage_logger()
@@ -112,5 +101,5 @@ def test_app_and_usage_loggers_share_builder_singletons(monkeypatch):
 
     assert app_logger_1 is app_logger_2
     assert usage_logger_1 is usage_logger_2
-    assert isinstance(app_logger_1.logger, MagicMock)
-    assert isinstance(usage_logger_1.logger, MagicMock)
+    assert app_logger_1.logger is fake_logger
+    assert usage_logger_1.logger is fake_logger
@@ -1,6 +1,6 @@
 """Tests for analytics repository selection."""
 
-from unittest.mock import MagicMock
+import pytest
 
 from src.infrastructure.container import build_analytics_repository
 from src.infrastructure.analytics_gnucash_repository import (
@@ -10,21 +10,23 @@ from src.infrastructure.analytics_views_repository import (
     AnalyticsViewsRepository,
 )
 
+pytestmark = pytest.mark.infrastructure_unit
 
-def test_build_analytics_repository_defaults_to_tables() -> None:
-    """Default selection should use table-backed repository."""
-    db_port = MagicMock()
 
-    repository = build_analytics_repository(db_port=db_port)
+def test_build_analytics_repository_defaults_to_tables(db_port_mock) -> None:
+    """Default selection should use table-backed repository."""
+    repository = build_analytics_repository(db_port=db_port_mock)
 
     assert isinstance(repository, AnalyticsGnuCashRepository)
 
 
-def test_build_analytics_repository_uses_views(monkeypatch) -> None:
+def test_build_analytics_repository_uses_views(
+    monkeypatch,
+    db_port_mock,
+) -> None:
     """Selection should honor the views mode."""
-    db_port = MagicMock()
     monkeypatch.setenv("ANALYTICS_READ_MODE", "views")
 
-    repository = build_analytics_repository(db_port=db_port)
+    repository = build_analytics_repository(db_port=db_port_mock)
 
     assert isinstance(repository, AnalyticsViewsRepository)
@@ -4,10 +4,18 @@ import pytest
 
 from src.infrastructure import db as db_module
 
+pytestmark = pytest.mark.infrastructure_unit
+
+
+@pytest.fixture(autouse=True)
+def _reset_engine_cache(monkeypatch):
+    """Clear cached engines and restore the originals after each test."""
+    monkeypatch.setattr(db_module, "_gnucash_engine", None)
+    monkeypatch.setattr(db_module, "_analytics_engine", None)
+
 
 def test_get_env_var_reads_environment(monkeypatch):
     """_get_env_var should load .env and return the requested value."""
-    monkeypatch.setattr(db_module.dotenv, "load_dotenv", lambda: None)
     monkeypatch.setenv("GNUCASH_DB_URL", "postgresql://example")
 
     assert db_module._get_env_var("GNUCASH_DB_URL") == "postgresql://example"
@@ -15,7 +23,6 @@ def test_get_env_var_reads_environment(monkeypatch):
 
 def test_get_env_var_raises_when_missing(monkeypatch):
     """Missing env vars should raise a RuntimeError."""
-    monkeypatch.setattr(db_module.dotenv, "load_dotenv", lambda: None)
     monkeypatch.delenv("ANALYTICS_DB_URL", raising=False)
 
     with pytest.raises(RuntimeError):
@@ -44,46 +51,35 @@ def test_create_engine_passes_pool_configuration(monkeypatch):
     assert captured["kwargs"]["future"] is True
 
 
-def test_get_gnucash_engine_caches_adapter(monkeypatch):
-    """get_gnucash_engine should memoize the created engine."""
-    db_module._gnucash_engine = None
-    created = []
-
-    def fake_create_engine(url):
-        created.append(url)
-        return f"engine:{url}"
-
-    monkeypatch.setattr(db_module, "_create_engine", fake_create_engine)
-    monkeypatch.setattr(db_module.dotenv, "load_dotenv", lambda: None)
-    monkeypatch.setenv("GNUCASH_DB_URL", "postgresql://gnucash")
-
-    engine_one = db_module.get_gnucash_engine()
-    engine_two = db_module.get_gnucash_engine()
-
-    assert engine_one is engine_two
-    assert engine_one == "engine:postgresql://gnucash"
-    assert created == ["postgresql://gnucash"]
-
-
-def test_get_analytics_engine_caches_adapter(monkeypatch):
-    """get_analytics_engine should memoize the analytics engine."""
-    db_module._analytics_engine = None
+@pytest.mark.parametrize(
+    ("getter_name", "env_var", "url"),
+    [
+        ("get_gnucash_engine", "GNUCASH_DB_URL", "postgresql://gnucash"),
+        (
+            "get_analytics_engine",
+            "ANALYTICS_DB_URL",
+            "postgresql://analytics",
+        ),
+    ],
+)
+def test_engine_getters_cache_adapter(monkeypatch, getter_name, env_var, url):
+    """Engine getters should memoize the created engine."""
     created = []
 
-    def fake_create_engine(url):
-        created.append(url)
-        return f"engine:{url}"
+    def fake_create_engine(db_url):
+        created.append(db_url)
+        return f"engine:{db_url}"
 
     monkeypatch.setattr(db_module, "_create_engine", fake_create_engine)
-    monkeypatch.setattr(db_module.dotenv, "load_dotenv", lambda: None)
-    monkeypatch.setenv("ANALYTICS_DB_URL", "postgresql://analytics")
+    monkeypatch.setenv(env_var, url)
+    getter = getattr(db_module, getter_name)
 
-    engine_one = db_module.get_analytics_engine()
-    engine_two = db_module.get_analytics_engine()
+    engine_one = getter()
+    engine_two = getter()
 
     assert engine_one is engine_two
-    assert engine_one == "engine:postgresql://analytics"
-    assert created == ["postgresql://analytics"]
+    assert engine_one == f"engine:{url}"
+    assert created == [url]
 
 
 def test_adapter_returns_underlying_engines(monkeypatch):
@@ -1,7 +1,8 @@
 """Tests for GnuCash repository backend selection."""
 
 from pathlib import Path
-from unittest.mock import MagicMock
+
+import pytest
 
 from src.infrastructure import gnucash_repository_factory as factory
 from src.infrastructure.analytics_gnucash_repository import (
@@ -10,17 +11,21 @@ from src.infrastructure.analytics_gnucash_repository import (
 from src.infrastructure.gnucash_repository import SqlAlchemyGnuCashRepository
 from src.infrastructure.settings import GnuCashSettings
 
+pytestmark = pytest.mark.infrastructure_unit
+
 
-def test_factory_defaults_to_sqlalchemy() -> None:
+def test_factory_defaults_to_sqlalchemy(db_port_mock) -> None:
     """Factory should return SQLAlchemy repository by default."""
-    db_port = MagicMock()
-    repository = factory.create_gnucash_repository(db_port)
+    repository = factory.create_gnucash_repository(db_port_mock)
     assert isinstance(repository, SqlAlchemyGnuCashRepository)
 
 
-def test_factory_uses_piecash_backend(monkeypatch, tmp_path: Path) -> None:
+def test_factory_uses_piecash_backend(
+    monkeypatch,
+    tmp_path: Path,
+    db_port_mock,
+) -> None:
     """Factory should return piecash repository when configured."""
-    db_port = MagicMock()
     dummy_repo = object()
 
     def _fake_repo(path, logger=None):
@@ -32,20 +37,19 @@ def test_factory_uses_piecash_backend(monkeypatch, tmp_path: Path) -> None:
     settings = GnuCashSettings(backend="piecash", piecash_file=tmp_path)
 
     repository = factory.create_gnucash_repository(
-        db_port,
+        db_port_mock,
         settings=settings,
     )
 
     assert repository is dummy_repo
 
 
-def test_factory_uses_analytics_backend() -> None:
+def test_factory_uses_analytics_backend(db_port_mock) -> None:
     """Factory should return analytics repository when configured."""
-    db_port = MagicMock()
     settings = GnuCashSettings(backend="analytics", piecash_file=None)
 
     repository = factory.create_gnucash_repository(
-        db_port,
+        db_port_mock,
         settings=settings,
     )
 
@@ -2,103 +2,87 @@
 
 from datetime import date
 from decimal import Decimal
-from types import SimpleNamespace
+
+import pytest
 
 from src.infrastructure import piecash_repository
 from src.infrastructure.piecash_repository import PieCashGnuCashRepository
-
-
-def test_fetch_currency_guid_reads_commodities(monkeypatch, tmp_path):
+from tests.infrastructure._piecash_fakes import (
+    FakeAccount,
+    FakeBook,
+    FakeCommodity,
+    FakeNumeric,
+    FakePrice,
+    FakeSplit,
+    FakeTransaction,
+    fake_piecash_module,
+    make_open_book,
+)
+
+pytestmark = pytest.mark.infrastructure_unit
+
+_EUR = FakeCommodity(guid="eur-guid", mnemonic="EUR", namespace="CURRENCY")
+_USD_EUR_PRICE = FakePrice(
+    commodity=FakeCommodity(guid="usd-guid"),
+    currency=FakeCommodity(guid="eur-guid"),
+    date=date(2024, 2, 1),
+    value_num=Decimal("10"),
+    value_denom=Decimal("1"),
+)
+_GBP_PRICE = FakePrice(
+    commodity=FakeCommodity(guid="gbp-guid"),
+    currency=FakeCommodity(guid="gbp-currency"),
+    date=date(2024, 2, 2),
+    value_num=Decimal("1"),
+    value_denom=Decimal("1"),
+)
+
+
+def test_fetch_currency_guid_reads_commodities(monkeypatch, fake_piecash_path):
     """Repository should return matching currency GUID."""
-    close_called = {"value": False}
-
-    class _Book:
-        def __init__(self):
-            self.commodities = [
-                SimpleNamespace(
-                    guid="eur-guid",
-                    mnemonic="EUR",
-                    namespace="CURRENCY",
-                )
-            ]
-            self.splits = []
-            self.prices = []
-
-        def close(self):
-            close_called["value"] = True
-
-    def _open_book(path, readonly=True, open_if_lock=True, check_exists=False):
-        assert path == str(tmp_path)
-        return _Book()
+    book = FakeBook(commodities=[_EUR])
 
     monkeypatch.setattr(
         piecash_repository,
         "load_piecash",
-        lambda: SimpleNamespace(open_book=_open_book),
+        lambda: fake_piecash_module(
+            make_open_book(lambda: book, fake_piecash_path)
+        ),
     )
 
-    repository = PieCashGnuCashRepository(tmp_path)
+    repository = PieCashGnuCashRepository(fake_piecash_path)
     result = repository.fetch_currency_guid("EUR")
 
     assert result == "eur-guid"
-    assert close_called["value"] is True
+    assert book.closed is True
 
 
-def test_fetch_net_worth_balances_aggregates_splits(monkeypatch, tmp_path):
+def test_fetch_net_worth_balances_aggregates_splits(
+    monkeypatch,
+    fake_piecash_path,
+):
     """Repository should aggregate split balances per account type."""
-    class _Numeric:
-        def __init__(self, num, denom):
-            self.num = num
-            self.denom = denom
-
-    class _Transaction:
-        def __init__(self, post_date):
-            self.post_date = post_date
-
-    class _Account:
-        def __init__(self, guid, name, account_type, commodity):
-            self.guid = guid
-            self.name = name
-            self.type = account_type
-            self.commodity = commodity
-
-    class _Split:
-        def __init__(self, account, transaction, value):
-            self.account = account
-            self.transaction = transaction
-            self.value = value
-
-    class _Book:
-        def __init__(self):
-            commodity = SimpleNamespace(
-                guid="eur-guid",
-                mnemonic="EUR",
-                namespace="CURRENCY",
-            )
-            account = _Account("a", "Cash", "ASSET", commodity)
-            self.commodities = [commodity]
-            self.splits = [
-                _Split(
-                    account=account,
-                    transaction=_Transaction(date(2024, 1, 2)),
-                    value=_Numeric(100, 1),
-                ),
-            ]
-            self.prices = []
-
-        def close(self):
-            return None
-
-    def _open_book(path, readonly=True, open_if_lock=True, check_exists=False):
-        return _Book()
+    account = FakeAccount("a", "Cash", "ASSET", _EUR)
+    book = FakeBook(
+        commodities=[_EUR],
+        splits=[
+            FakeSplit(
+                account=account,
+                transaction=FakeTransaction(date(2024, 1, 2)),
+                value=FakeNumeric(100, 1),
+            ),
+        ],
+    )
 
     monkeypatch.setattr(
         piecash_repository,
         "load_piecash",
-        lambda: SimpleNamespace(open_book=_open_book),
+        lambda: fake_piecash_module(
+            make_open_book(lambda: book, fake_piecash_path)
+        ),
     )
 
-    repository = PieCashGnuCashRepository(tmp_path)
+    repository = PieCashGnuCashRepository(fake_piecash_path)
     rows = repository.fetch_net_worth_balances(
         start_date=date(2024, 1, 1),
         end_date=date(2024, 12, 31),
@@ -108,46 +92,21 @@ def test_fetch_net_worth_balances_aggregates_splits(monkeypatch, tmp_path):
     assert rows[0].balance == Decimal("100")
 
 
-def test_fetch_latest_prices_filters_currency(monkeypatch, tmp_path):
+def test_fetch_latest_prices_filters_currency(monkeypatch, fake_piecash_path):
     """Repository should filter prices by currency GUID."""
-    close_called = {"value": False}
-
-    class _Book:
-        def __init__(self):
-            self.commodities = []
-            self.splits = []
-            self.prices = [
-                SimpleNamespace(
-                    commodity=SimpleNamespace(guid="usd-guid"),
-                    currency=SimpleNamespace(guid="eur-guid"),
-                    date=date(2024, 2, 1),
-                    value_num=Decimal("10"),
-                    value_denom=Decimal("1"),
-                ),
-                SimpleNamespace(
-                    commodity=SimpleNamespace(guid="gbp-guid"),
-                    currency=SimpleNamespace(guid="gbp-currency"),
-                    date=date(2024, 2, 2),
-                    value_num=Decimal("1"),
-                    value_denom=Decimal("1"),
-                ),
-            ]
-
-        def close(self):
-            close_called["value"] = True
-
-    def _open_book(path, readonly=True, open_if_lock=True, check_exists=False):
-        return _Book()
+    book = FakeBook(prices=[_USD_EUR_PRICE, _GBP_PRICE])
 
     monkeypatch.setattr(
         piecash_repository,
         "load_piecash",
-        lambda: SimpleNamespace(open_book=_open_book),
+        lambda: fake_piecash_module(
+            make_open_book(lambda: book, fake_piecash_path)
+        ),
     )
 
-    repository = PieCashGnuCashRepository(tmp_path)
+    repository = PieCashGnuCashRepository(fake_piecash_path)
     rows = repository.fetch_latest_prices("eur-guid", end_date=None)
 
     assert len(rows) == 1
     assert rows[0].commodity_guid == "usd-guid"
-    assert close_called["value"] is True
+    assert book.closed is True
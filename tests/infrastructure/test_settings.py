@@ -2,8 +2,12 @@
 
 from pathlib import Path
 
+import pytest
+
 from src.infrastructure.settings import GnuCashSettings
 
+pytestmark = pytest.mark.infrastructure_unit
+
 
 def test_from_env_uses_file_path(monkeypatch, tmp_path: Path) -> None:
     """File paths should resolve to Path instances."""
@@ -23,3 +27,23 @@ def test_from_env_allows_uri(monkeypatch) -> None:
     settings = GnuCashSettings.from_env()
 
     assert settings.piecash_file == uri
+
+
+def test_from_env_resolves_relative_path_against_cwd(
+    monkeypatch,
+    tmp_path: Path,
+) -> None:
+    """Relative paths should follow the current directory on every call."""
+    first_dir = tmp_path / "a"
+    second_dir = tmp_path / "b"
+    first_dir.mkdir()
+    second_dir.mkdir()
+    monkeypatch.setenv("PIECASH_FILE", "book.gnucash")
+
+    monkeypatch.chdir(first_dir)
+    first = GnuCashSettings.from_env()
+    monkeypatch.chdir(second_dir)
+    second = GnuCashSettings.from_env()
+
+    assert first.piecash_file == (first_dir / "book.gnucash").resolve()
+    assert second.piecash_file == (second_dir / "book.gnucash").resolve()
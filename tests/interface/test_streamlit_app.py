@@ -1,31 +1,92 @@
 """Tests for the Streamlit app module."""
 
+import contextlib
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import lru_cache
 from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import streamlit
+from streamlit.delta_generator import DeltaGenerator
 
 from src.adapters.interface.streamlit import app
 
 
-def test_fetch_accounts_invokes_use_case(monkeypatch):
-    """_fetch_accounts should instantiate the adapter and use case."""
-    fake_accounts = ["a"]
+@lru_cache(maxsize=1)
+def _stub_adapter() -> str:
+    """Stand-in for the database adapter builders."""
+    return "adapter"
 
-    class _FakeUseCase:
-        def __init__(self, repository):
-            self.repository = repository
 
-        def execute(self):
-            return fake_accounts
+@lru_cache(maxsize=1)
+def _stub_repo() -> str:
+    """Stand-in for the repository builders."""
+    return "repository"
+
+
+def _make_fake_usecase(return_value) -> type:
+    """Return a use case class whose execute() yields ``return_value``.
+
+    The constructor checks that every repository it receives is the shared
+    ``_stub_repo()`` installed by ``patched_app``.
+    """
+
+    def __init__(self, **repositories) -> None:
+        assert all(repo is _stub_repo() for repo in repositories.values())
+
+    def execute(self, **_kwargs):
+        return return_value
+
+    return type("_FakeUseCase", (), {"__init__": __init__, "execute": execute})
+
+
+@dataclass(frozen=True, slots=True)
+class _Account:
+    """Account row exposing the attributes read by the accounts page."""
+
+    guid: str
+    name: str
+    account_type: str
+    commodity_guid: str
+    parent_guid: str | None
 
-    monkeypatch.setattr(
-        app,
-        "build_accounts_repository",
-        lambda: "repository",
-    )
-    monkeypatch.setattr(
-        app,
-        "GetAccountsUseCase",
-        lambda repository: _FakeUseCase(repository),
-    )
+
+_ACCOUNTS: tuple[_Account, ...] = (
+    _Account(
+        guid="1",
+        name="Checking",
+        account_type="BANK",
+        commodity_guid="USD",
+        parent_guid=None,
+    ),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _Summary:
+    """Net worth summary exposing the attributes read by the dashboard."""
+
+    asset_total: Decimal
+    liability_total: Decimal
+    net_worth: Decimal
+    currency_code: str
+
+
+_SUMMARY = _Summary(
+    asset_total=Decimal("1"),
+    liability_total=Decimal("2"),
+    net_worth=Decimal("3"),
+    currency_code="EUR",
+)
+
+
+def test_fetch_accounts_invokes_use_case(patched_app):
+    """_fetch_accounts should instantiate the adapter and use case."""
+    fake_accounts = ["a"]
+
+    patched_app.set("GetAccountsUseCase", _make_fake_usecase(fake_accounts))
 
     result = app._fetch_accounts()
 
@@ -40,58 +101,25 @@ def test_load_accounts_uses_fetch(monkeypatch):
     assert result == fake_accounts
 
 
-def test_fetch_net_worth_summary_invokes_use_case(monkeypatch):
+def test_fetch_net_worth_summary_invokes_use_case(patched_app):
     """_fetch_net_worth_summary should instantiate the adapter and use case."""
-    fake_summary = SimpleNamespace(
-        asset_total=1,
-        liability_total=2,
-        net_worth=3,
-        currency_code="EUR",
-    )
-
-    class _FakeUseCase:
-        def __init__(self, gnucash_repository):
-            self.gnucash_repository = gnucash_repository
-
-        def execute(self, start_date=None, end_date=None):
-            return fake_summary
-
-    monkeypatch.setattr(
-        app,
-        "build_analytics_repository",
-        lambda: "repository",
-    )
-    monkeypatch.setattr(
-        app,
+    patched_app.set(
         "GetNetWorthSummaryUseCase",
-        lambda gnucash_repository: _FakeUseCase(gnucash_repository),
+        _make_fake_usecase(_SUMMARY),
     )
 
     result = app._fetch_net_worth_summary(start_date=None, end_date=None)
 
-    assert result == fake_summary
+    assert result is _SUMMARY
 
 
-def test_fetch_account_balances_invokes_use_case(monkeypatch):
+def test_fetch_account_balances_invokes_use_case(patched_app):
     """_fetch_account_balances should instantiate the adapter and use case."""
     fake_balances = ["balance"]
 
-    class _FakeUseCase:
-        def __init__(self, gnucash_repository):
-            self.gnucash_repository = gnucash_repository
-
-        def execute(self, end_date=None, target_currency="EUR"):
-            return fake_balances
-
-    monkeypatch.setattr(
-        app,
-        "build_analytics_repository",
-        lambda: "repository",
-    )
-    monkeypatch.setattr(
-        app,
+    patched_app.set(
         "GetAccountBalancesUseCase",
-        lambda gnucash_repository: _FakeUseCase(gnucash_repository),
+        _make_fake_usecase(fake_balances),
     )
 
     result = app._fetch_account_balances(
@@ -117,22 +145,58 @@ def test_load_account_balances_uses_fetch(monkeypatch):
     assert result == fake_balances
 
 
+_FLAG_CONFIG, _FLAG_TITLE, _FLAG_WARN = 1, 2, 4
+
+
 class _FakeStreamlit:
+    __slots__ = (
+        "flags",
+        "config_kwargs",
+        "title_text",
+        "subheader_text",
+        "captions",
+        "warning_text",
+        "dataframe_first_row",
+        "dataframe_width",
+        "dataframe_hide_index",
+        "sidebar",
+        "metric_columns",
+        "session_state",
+    )
+
     def __init__(self) -> None:
-        self.config_called = False
-        self.title_called = False
-        self.captions: list[str] = []
-        self.warning_called = False
-        self.dataframe_payload = None
         self.sidebar = _FakeSidebar()
+        self.metric_columns = (
+            _FakeMetricColumn(),
+            _FakeMetricColumn(),
+            _FakeMetricColumn(),
+        )
+        self.captions: list[str] = []
         self.session_state: dict[str, object] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear recorded calls so the instance can serve another test."""
+        self.flags = 0
+        self.config_kwargs = None
+        self.title_text = None
+        self.subheader_text = None
+        self.warning_text = None
+        self.captions.clear()
+        self.dataframe_first_row = None
+        self.dataframe_width = None
+        self.dataframe_hide_index = None
+        self.sidebar.selectbox_value = "Accounts"
+        for column in self.metric_columns:
+            column.reset()
+        self.session_state.clear()
 
     def set_page_config(self, **kwargs):
-        self.config_called = True
+        self.flags |= _FLAG_CONFIG
         self.config_kwargs = kwargs
 
     def title(self, text: str):
-        self.title_called = True
+        self.flags |= _FLAG_TITLE
         self.title_text = text
 
     def subheader(self, text: str):
@@ -148,20 +212,22 @@ class _FakeStreamlit:
         self.captions.append(text)
 
     def warning(self, text: str):
-        self.warning_called = True
+        self.flags |= _FLAG_WARN
         self.warning_text = text
 
     def dataframe(self, data, **kwargs):
-        self.dataframe_payload = (data, kwargs)
+        self.dataframe_first_row = data[0] if data else None
+        self.dataframe_width = kwargs.get("width")
+        self.dataframe_hide_index = kwargs.get("hide_index")
 
     def columns(self, spec):
-        return [_FakeMetricColumn(), _FakeMetricColumn(), _FakeMetricColumn()]
-
-    def cache_data(self, **_kwargs):
-        def decorator(func):
-            return func
-
-        return decorator
+        count = spec if isinstance(spec, int) else len(spec)
+        if count > len(self.metric_columns):
+            raise ValueError(
+                f"_FakeStreamlit supports at most {len(self.metric_columns)} "
+                f"columns, got {count}"
+            )
+        return list(self.metric_columns[:count])
 
     def text_input(self, _label: str, value: str = "", key: str | None = None, **_kwargs):
         if key:
@@ -202,6 +268,8 @@ class _FakeStreamlit:
 
 
 class _FakeSidebar:
+    __slots__ = ("selectbox_value",)
+
     def __init__(self) -> None:
         self.selectbox_value = "Accounts"
 
@@ -222,67 +290,110 @@ class _FakeSidebar:
 
 
 class _FakeMetricColumn:
+    __slots__ = ("label", "value", "delta")
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the last metric rendered in this column."""
+        self.label = None
+        self.value = None
+        self.delta = None
+
     def metric(self, label: str, value: str, delta: str | None = None):
         self.label = label
         self.value = value
         self.delta = delta
 
 
-def test_main_displays_accounts(monkeypatch):
-    """main should render the dataframe when accounts exist."""
-    fake_st = _FakeStreamlit()
-    accounts = [
-        SimpleNamespace(
-            guid="1",
-            name="Checking",
-            account_type="BANK",
-            commodity_guid="USD",
-            parent_guid=None,
-        )
-    ]
-
-    fake_st.sidebar.selectbox_value = "Accounts"
-    monkeypatch.setattr(app, "st", fake_st)
-    monkeypatch.setattr(app, "_load_accounts", lambda **_kwargs: accounts)
-    monkeypatch.setattr(
-        app,
-        "_load_net_worth_summary",
-        lambda start_date, end_date: SimpleNamespace(
-            asset_total=1,
-            liability_total=2,
-            net_worth=3,
-            currency_code="EUR",
-        ),
-    )
-
-    app.main()
-
-    assert fake_st.config_called
-    assert fake_st.title_called
-    assert fake_st.warning_called is False
-    table_data, kwargs = fake_st.dataframe_payload
-    assert table_data[0]["Name"] == "Checking"
-    assert kwargs["width"] == "stretch"
-    assert kwargs["hide_index"] is True
-
-
-def test_main_warns_when_no_accounts(monkeypatch):
-    """main should warn the user when analytics has no data."""
-    fake_st = _FakeStreamlit()
-    fake_st.sidebar.selectbox_value = "Accounts"
-    monkeypatch.setattr(app, "st", fake_st)
-    monkeypatch.setattr(app, "_load_accounts", lambda **_kwargs: [])
-    monkeypatch.setattr(
-        app,
-        "_load_net_worth_summary",
-        lambda start_date, end_date: SimpleNamespace(
-            asset_total=1,
-            liability_total=2,
-            net_worth=3,
-            currency_code="EUR",
-        ),
-    )
+@lru_cache(maxsize=1)
+def _singleton_st() -> _FakeStreamlit:
+    """Return the fake Streamlit module shared by every test in the worker."""
+    return _FakeStreamlit()
+
+
+@pytest.fixture
+def fake_st() -> _FakeStreamlit:
+    """Return the shared fake Streamlit module with its state cleared."""
+    fake = _singleton_st()
+    fake.reset()
+    return fake
+
+
+@pytest.fixture
+def patched_app(fake_st: _FakeStreamlit):
+    """Patch app's Streamlit module, wiring and loaders in a single pass.
+
+    Tests override the one attribute they care about with ``set(name,
+    value)``; the patches are entered on one ExitStack and unwound in
+    reverse order when the test finishes.
+    """
+    patches = {
+        "st": fake_st,
+        "build_database_adapter": _stub_adapter,
+        "build_accounts_repository": _stub_repo,
+        "build_analytics_repository": _stub_repo,
+        "_load_accounts": lambda **_kwargs: (),
+        "_load_net_worth_summary": lambda *_args, **_kwargs: _SUMMARY,
+    }
+    with contextlib.ExitStack() as stack:
+        for name, value in patches.items():
+            stack.enter_context(patch.object(app, name, value))
+
+        def _set(name: str, value) -> None:
+            stack.enter_context(patch.object(app, name, value))
+
+        yield SimpleNamespace(st=fake_st, set=_set)
+
+
+@pytest.mark.parametrize(
+    ("accounts", "expect_warning"),
+    [(_ACCOUNTS, False), ((), True)],
+    ids=["displays_accounts", "warns_when_no_accounts"],
+)
+def test_render_accounts_view(patched_app, accounts, expect_warning):
+    """The accounts page should show the table, or warn when it is empty."""
+    app._render_accounts_view(accounts)
+
+    fake_st = patched_app.st
+    assert bool(fake_st.flags & _FLAG_WARN) is expect_warning
+    if not expect_warning:
+        assert fake_st.dataframe_first_row["Name"] == "Checking"
+        assert fake_st.dataframe_width == "stretch"
+        assert fake_st.dataframe_hide_index is True
+
+
+@pytest.mark.smoke
+def test_main_renders_accounts_page(patched_app):
+    """main should configure the page and route to the accounts view."""
+    patched_app.set("_load_accounts", lambda **_kwargs: _ACCOUNTS)
 
     app.main()
 
-    assert fake_st.warning_called
+    fake_st = patched_app.st
+    assert fake_st.flags & _FLAG_CONFIG
+    assert fake_st.flags & _FLAG_TITLE
+    assert fake_st.dataframe_first_row["Name"] == "Checking"
+
+
+@pytest.mark.parametrize(
+    ("fake_cls", "real"),
+    [
+        (_FakeStreamlit, streamlit),
+        (_FakeSidebar, DeltaGenerator),
+        (_FakeMetricColumn, DeltaGenerator),
+    ],
+    ids=["module", "sidebar", "column"],
+)
+def test_fakes_only_expose_streamlit_api(fake_cls, real):
+    """Hand-written fakes should not drift from the Streamlit API."""
+    fake_methods = {
+        name
+        for name, value in vars(fake_cls).items()
+        if callable(value) and not name.startswith("_") and name != "reset"
+    }
+
+    missing = sorted(name for name in fake_methods if not hasattr(real, name))
+
+    assert missing == []